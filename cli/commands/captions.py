@@ -0,0 +1,109 @@
+"""AI caption CLI commands."""
+
+import asyncio
+from typing import Optional
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+
+@click.command(name="backfill-captions")
+@click.option("--category", default=None, help="Only caption this category")
+@click.option(
+    "--limit",
+    type=int,
+    default=None,
+    help="Maximum number of items to caption (default: all)",
+)
+@click.option(
+    "--regenerate",
+    is_flag=True,
+    default=False,
+    help="Replace existing AI captions too (manual captions are never touched)",
+)
+@click.option(
+    "--concurrency",
+    type=int,
+    default=None,
+    help="Distinct prompts in flight at once (default: CAPTION_BATCH_CONCURRENCY)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Count items and distinct prompts without calling the API",
+)
+def backfill_captions(
+    category: Optional[str],
+    limit: Optional[int],
+    regenerate: bool,
+    concurrency: Optional[int],
+    dry_run: bool,
+):
+    """Generate AI captions for every active media item that lacks one.
+
+    Items whose prompts are identical (same category, title, tags and
+    metadata) share one API call, and captions already generated for the
+    same prompt within CAPTION_CACHE_TTL_SECONDS are reused.
+
+    Examples:
+
+        storydump-cli backfill-captions --dry-run
+
+        storydump-cli backfill-captions --category memes --limit 100
+    """
+    from src.config.settings import settings
+    from src.services.core.caption_service import CaptionService
+    from src.utils.caption_cache import get_caption_cache
+
+    if not settings.ANTHROPIC_API_KEY and not dry_run:
+        console.print("[red]ANTHROPIC_API_KEY is not set[/red]")
+        return
+
+    with CaptionService() as service:
+        items = service.media_repo.get_all(is_active=True, category=category)
+        todo = [
+            item
+            for item in items
+            if not item.caption and (regenerate or not item.generated_caption)
+        ]
+        if limit:
+            todo = todo[:limit]
+
+        prompts = {service._build_prompt(item) for item in todo}
+        console.print(
+            f"[bold blue]{len(todo)} item(s) to caption[/bold blue] "
+            f"({len(prompts)} distinct prompt(s))"
+        )
+        if dry_run or not todo:
+            return
+
+        try:
+            results = asyncio.run(
+                service.generate_captions(
+                    todo,
+                    regenerate=regenerate,
+                    concurrency=concurrency,
+                    triggered_by="cli",
+                )
+            )
+        except Exception as e:
+            console.print(f"\n[red]Caption backfill failed:[/red] {e}")
+            return
+
+    generated = sum(1 for caption in results.values() if caption)
+    table = Table(title="Caption Backfill Results")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_row("Items", str(len(todo)))
+    table.add_row("Distinct prompts", str(len(prompts)))
+    table.add_row("Captioned", str(generated))
+    failed = len(todo) - generated
+    table.add_row("Failed", f"[red]{failed}[/red]" if failed else "0")
+    cache = get_caption_cache()
+    if cache is not None:
+        table.add_row("Cache hits", str(cache.stats()["hits"]))
+    console.print(table)
@@ -4,6 +4,7 @@ import click
 from rich.console import Console
 
 from cli.commands.backfill import backfill_instagram, backfill_status
+from cli.commands.captions import backfill_captions
 from cli.commands.google_drive import (
     connect_google_drive,
     disconnect_google_drive,
@@ -70,6 +71,7 @@ cli.add_command(sync_media)
 cli.add_command(sync_status)
 cli.add_command(backfill_instagram)
 cli.add_command(backfill_status)
+cli.add_command(backfill_captions)
 cli.add_command(dedup_media)
 cli.add_command(pool_health)
 cli.add_command(revoke_tokens)